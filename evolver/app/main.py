@@ -1,11 +1,18 @@
 import asyncio
+import functools
+import hashlib
+import threading
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import BackgroundTasks, FastAPI, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
 import evolver.util
 from evolver import __project__, __version__
 from evolver.app.models import SchemaResponse
+from evolver.app.responses import ORJSONResponse
 from evolver.base import ImportString, require_all_fields
 from evolver.device import Evolver
 from evolver.settings import app_settings
@@ -21,14 +28,23 @@ async def lifespan(app: FastAPI):
         app.state.evolver = Evolver.create(Evolver.Config.load(app_settings.CONFIG_FILE))
     else:
         app.state.evolver = Evolver.create()
-    asyncio.create_task(evolver_async_loop())
+    # Serializes reconfiguration such that concurrent requests are applied in the order they arrive. This is created
+    # here rather than at import since an asyncio.Lock is bound to the event loop that first contends it.
+    app.state.update_lock = asyncio.Lock()
+    stop = threading.Event()
+    app.state.loop_trigger.clear()
+    loop_thread = threading.Thread(target=evolver_loop, args=(stop,), daemon=True)
+    loop_thread.start()
     yield
     # Shutdown:
-    ...
+    stop.set()
+    app.state.loop_trigger.set()
+    loop_thread.join()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.state.evolver = None
+app.state.loop_trigger = threading.Event()  # Set to wake the control loop early, e.g., upon reconfiguration.
 
 
 @require_all_fields
@@ -37,52 +53,119 @@ class EvolverConfigWithoutDefaults(Evolver.Config): ...
 
 @app.get("/")
 async def describe_evolver():
-    return {
-        "config": app.state.evolver.config_model,
-        "state": app.state.evolver.state,
-        "last_read": app.state.evolver.last_read,
-    }
+    evolver = app.state.evolver
+    return ORJSONResponse(
+        {
+            "config": evolver.config_model,
+            "state": evolver.state,
+            "last_read": evolver.last_read,
+        }
+    )
 
 
 @app.get("/state")
 async def get_state():
-    return {
-        "state": app.state.evolver.state,
-        "last_read": app.state.evolver.last_read,
-    }
+    evolver = app.state.evolver
+    return ORJSONResponse(
+        {
+            "state": evolver.state,
+            "last_read": evolver.last_read,
+        }
+    )
 
 
 @app.post("/")
-async def update_evolver(config: EvolverConfigWithoutDefaults):
-    app.state.evolver = Evolver.create(config)
-    app.state.evolver.config_model.save(app_settings.CONFIG_FILE)
+async def update_evolver(config: EvolverConfigWithoutDefaults, background_tasks: BackgroundTasks):
+    async with app.state.update_lock:
+        # Instantiating hardware is blocking so is offloaded from the event loop.
+        app.state.evolver = await run_in_threadpool(Evolver.create, config)
+    app.state.loop_trigger.set()
+    # Persist the new config once the response has been sent rather than delaying it.
+    background_tasks.add_task(_save_config)
+
+
+# Serializes writes to the config file, see ``_save_config``.
+_save_lock = threading.Lock()
+
+
+def _save_config():
+    """Save the config of the current evolver to ``app_settings.CONFIG_FILE``.
+
+    Saves from consecutive updates run independently in the threadpool so are serialized by ``_save_lock``. The
+    config is read only once the lock is held such that the last save to run always writes the latest config, even if
+    saves complete out of order.
+    """
+    with _save_lock:
+        app.state.evolver.config_model.save(app_settings.CONFIG_FILE)
+
+
+_DEFAULT_SCHEMA_CLASSINFO = evolver.util.fully_qualified_name(Evolver)
+
+
+@functools.lru_cache(maxsize=32)
+def _schema_json(classinfo: type) -> bytes:
+    """Return the serialized ``SchemaResponse`` for ``classinfo``. Schemas are static so generate them only once."""
+    # ``classinfo`` has already been imported so skip validating it again.
+    return orjson.dumps(SchemaResponse.model_construct(classinfo=classinfo).model_dump(mode="json"))
 
 
 @app.get("/schema/", response_model=SchemaResponse)
-async def get_schema(classinfo: ImportString | None = evolver.util.fully_qualified_name(Evolver)) -> SchemaResponse:
-    return SchemaResponse(classinfo=classinfo)
+async def get_schema(classinfo: ImportString | None = _DEFAULT_SCHEMA_CLASSINFO):
+    # FastAPI doesn't validate defaults so the default is still a str rather than an imported class.
+    if classinfo == _DEFAULT_SCHEMA_CLASSINFO:
+        classinfo = Evolver
+    # Note: ``response_model`` is retained for the openapi docs only. Returning a response directly skips FastAPI
+    # re-validating the already valid ``SchemaResponse``.
+    return Response(_schema_json(classinfo), media_type="application/json")
 
 
 @app.get("/history/{name}")
-async def get_history(name: str):
-    return app.state.evolver.history.get(name)
+async def get_history(name: str, t_start: float | None = None, t_stop: float | None = None):
+    # History backends may be arbitrarily slow (e.g., file or db backed) so don't block the event loop.
+    return ORJSONResponse(await run_in_threadpool(app.state.evolver.history.get, name, t_start=t_start, t_stop=t_stop))
 
 
-@app.get("/healthz")
-async def healthz():
-    return {"message": f"Running '{__project__}' ver: '{__version__}'"}
+_HEALTHZ_JSON = orjson.dumps({"message": f"Running '{__project__}' ver: '{__version__}'"})
+_HEALTHZ_HEADERS = {
+    "ETag": f'"{hashlib.md5(_HEALTHZ_JSON, usedforsecurity=False).hexdigest()}"',
+    "Cache-Control": "no-cache",
+}
 
 
-async def evolver_async_loop():
-    while True:
+@app.get("/healthz")
+async def healthz(request: Request):
+    # The response is constant so let polling clients revalidate with If-None-Match rather than re-fetch the body.
+    if request.headers.get("if-none-match") == _HEALTHZ_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_HEALTHZ_HEADERS)
+    return Response(_HEALTHZ_JSON, media_type="application/json", headers=_HEALTHZ_HEADERS)
+
+
+def evolver_loop(stop: threading.Event):
+    """Run the control loop until ``stop`` is set.
+
+    This is run in its own thread since ``loop_once()`` performs blocking hardware I/O which would otherwise stall
+    request handling on the event loop. Iterations are scheduled against a monotonic deadline so that the time taken
+    by ``loop_once()`` doesn't add to the interval. Setting ``app.state.loop_trigger`` runs the next iteration early.
+    """
+    trigger = app.state.loop_trigger
+    deadline = time.monotonic()
+    while not stop.is_set():
         app.state.evolver.loop_once()
-        await asyncio.sleep(app.state.evolver.interval)
+        # Don't try to catch up on missed iterations if ``loop_once()`` overran the interval.
+        deadline = max(deadline + app.state.evolver.interval, time.monotonic())
+        if trigger.wait(timeout=deadline - time.monotonic()):
+            trigger.clear()
+            deadline = time.monotonic()
 
 
 def start():
     import uvicorn
 
-    uvicorn.run(app, host=app_settings.HOST, port=app_settings.PORT, log_level="info")
+    # Note: The app owns the hardware (serial port etc.) and holds all state in-process so it must only ever be run as
+    # a single worker. uvicorn[standard] provides uvloop and httptools which uvicorn will otherwise auto-select.
+    uvicorn.run(
+        app, host=app_settings.HOST, port=app_settings.PORT, log_level="info", access_log=app_settings.ACCESS_LOG
+    )
 
 
 if __name__ == "__main__":
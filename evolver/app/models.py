@@ -1,3 +1,5 @@
+import copy
+import functools
 from typing import Any
 
 import pydantic
@@ -5,6 +7,19 @@ import pydantic
 from evolver.base import BaseConfig, BaseInterface, ImportString
 
 
+@functools.lru_cache(maxsize=512)
+def _cached_model_json_schema(model: type[pydantic.BaseModel]) -> dict:
+    return model.model_json_schema()
+
+
+def _model_json_schema(model: type[pydantic.BaseModel]) -> dict:
+    """Return ``model.model_json_schema()``, generating it only once per model.
+
+    A copy of the cached schema is returned such that callers are free to mutate it.
+    """
+    return copy.deepcopy(_cached_model_json_schema(model))
+
+
 class SchemaResponse(pydantic.BaseModel):
     classinfo: ImportString
     config: dict | None = None
@@ -13,12 +28,12 @@ class SchemaResponse(pydantic.BaseModel):
 
     def model_post_init(self, __context: Any) -> None:
         if issubclass(self.classinfo, BaseConfig):
-            self.config = self.classinfo.model_json_schema()
+            self.config = _model_json_schema(self.classinfo)
         elif issubclass(self.classinfo, BaseInterface):
-            self.config = self.classinfo.Config.model_json_schema()
+            self.config = _model_json_schema(self.classinfo.Config)
 
             if hasattr(self.classinfo, "Input") and issubclass(self.classinfo.Input, pydantic.BaseModel):
-                self.input = self.classinfo.Input.model_json_schema()
+                self.input = _model_json_schema(self.classinfo.Input)
 
             if hasattr(self.classinfo, "Output") and issubclass(self.classinfo.Output, pydantic.BaseModel):
-                self.output = self.classinfo.Output.model_json_schema()
+                self.output = _model_json_schema(self.classinfo.Output)
@@ -0,0 +1,16 @@
+from typing import Any
+
+import fastapi.responses
+import orjson
+import pydantic_core
+
+
+class ORJSONResponse(fastapi.responses.ORJSONResponse):
+    """ORJSONResponse that also serializes pydantic models, including those nested within containers.
+
+    Returning an instance of this directly from an endpoint bypasses FastAPI's ``jsonable_encoder``, which would
+    otherwise recursively walk the entire content in Python before it gets serialized.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=pydantic_core.to_jsonable_python, option=orjson.OPT_NON_STR_KEYS)
@@ -6,12 +6,23 @@ from evolver.device import Evolver
 from evolver.settings import app_settings
 
 
-@pytest.fixture
-def app_client(tmp_path, monkeypatch):
-    monkeypatch.setattr(app_settings, "CONFIG_FILE", tmp_path / app_settings.CONFIG_FILE)
+@pytest.fixture(scope="module")
+def _app_client(tmp_path_factory):
+    # Start the app (and its lifespan) only once per module, see ``app_client`` for per-test state reset. This is not
+    # session scoped such that the control loop thread and patched settings don't outlive the app tests.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(app_settings, "CONFIG_FILE", tmp_path_factory.mktemp("app") / app_settings.CONFIG_FILE)
 
-    # Create and save a default config file to be read upon app startup.
-    Evolver.Config().save(app_settings.CONFIG_FILE)
+        # Create and save a default config file to be read upon app startup.
+        Evolver.Config().save(app_settings.CONFIG_FILE)
+
+        with TestClient(app) as client:
+            yield client
 
-    with TestClient(app) as client:
-        yield client
+
+@pytest.fixture
+def app_client(_app_client):
+    # Reset the config file and evolver, as would be on startup, in place of restarting the app for each test.
+    Evolver.Config().save(app_settings.CONFIG_FILE)
+    app.state.evolver = Evolver.create(Evolver.Config.load(app_settings.CONFIG_FILE))
+    return _app_client
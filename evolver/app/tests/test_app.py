@@ -1,16 +1,22 @@
-import json
+import asyncio
+import threading
+import time
 
+import httpx
 import pytest
 import yaml
 from fastapi.openapi.utils import get_openapi
 
 import evolver.util
 from evolver import __version__
-from evolver.app.main import EvolverConfigWithoutDefaults, SchemaResponse, app
-from evolver.base import BaseConfig, BaseInterface, ConfigDescriptor
+from evolver.app.main import EvolverConfigWithoutDefaults, SchemaResponse, _schema_json, app
+from evolver.base import BaseConfig, BaseInterface, ConfigDescriptor, SafeLoader
+from evolver.controller.demo import NoOpController
 from evolver.device import Evolver
 from evolver.hardware.demo import NoOpCalibrator, NoOpEffectorDriver, NoOpSensorDriver
 from evolver.hardware.interface import EffectorDriver, SensorDriver
+from evolver.hardware.standard.temperature import Temperature
+from evolver.serial import create_mock_serial
 from evolver.settings import app_settings
 
 
@@ -31,10 +37,64 @@ class TestApp:
         if __version__:
             assert __version__ in response.json()["message"], response.json()
 
+    def test_healthz_etag(self, app_client):
+        response = app_client.get("/healthz")
+        etag = response.headers["etag"]
+        response = app_client.get("/healthz", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        response = app_client.get("/healthz", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.headers["etag"] == etag
+
     def test_evolver_app_default_config_dump_endpoint(self, app_client):
         response = app_client.get("/")
         assert response.status_code == 200
-        assert sorted(response.json().keys()) == ["config", "last_read", "state"]
+        assert response.json().keys() == {"config", "last_read", "state"}
+
+    def test_state_endpoint(self, app_client):
+        app.state.evolver = Evolver(hardware={"test": NoOpSensorDriver(vials=[0, 1])})
+        app.state.evolver.read_state()
+        response = app_client.get("/state")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        state = response.json()["state"]
+        assert state["test"] == {
+            str(vial): NoOpSensorDriver.Output(vial=vial, raw=1, value=2).model_dump() for vial in (0, 1)
+        }
+
+    def test_state_endpoint_during_read(self, app_client, monkeypatch):
+        # The control loop reads hardware in its own thread, so reads must never expose partially populated outputs.
+        do_serial = Temperature._do_serial
+
+        def slow_do_serial(self, *args, **kwargs):
+            time.sleep(0.02)
+            return do_serial(self, *args, **kwargs)
+
+        monkeypatch.setattr(Temperature, "_do_serial", slow_do_serial)
+        evolver = Evolver.create(
+            {"hardware": {"temp": {"classinfo": Temperature, "config": {"addr": "temp", "slots": 2}}}}
+        )
+        evolver.serial = create_mock_serial({b"tempr,4095,4095,_!": b"tempa,1,2,end"})
+        evolver.read_state()
+        app.state.evolver = evolver
+
+        reader = threading.Thread(target=lambda: [evolver.read_state() for _ in range(10)])
+        reader.start()
+        states = []
+        while reader.is_alive():
+            states.append(app_client.get("/state").json()["state"]["temp"])
+        reader.join()
+        assert states
+        assert all(state.keys() == {"0", "1"} for state in states)
+
+    def test_history_endpoint(self, app_client):
+        app.state.evolver = Evolver(hardware={"test": NoOpSensorDriver(vials=[0])})
+        app.state.evolver.read_state()
+        response = app_client.get("/history/test")
+        assert response.status_code == 200
+        _, data = response.json()[-1]
+        assert data == {"0": NoOpSensorDriver.Output(vial=0, raw=1, value=2).model_dump()}
 
     def test_EvolverConfigWithoutDefaults(self):
         EvolverConfigWithoutDefaults.model_validate(Evolver.Config().model_dump())
@@ -46,25 +106,59 @@ class TestApp:
         response = app_client.post("/", json=data)
         # all config fields are required so the above post failed with an Unprocessable Entity error.
         assert response.status_code == 422
-        contents = json.loads(response.content)
+        contents = response.json()
         for content in contents["detail"]:
             assert content["msg"] == "Field required"
 
-        new_data = Evolver.Config().copy(update=data)
-        response = app_client.post("/", data=new_data.model_dump_json())
+        new_data = {**Evolver.Config().model_dump(mode="json"), **data}
+        response = app_client.post("/", json=new_data)
         assert response.status_code == 200
         newconfig = app_client.get("/").json()["config"]
         assert newconfig["hardware"]["test"]["classinfo"] == "evolver.hardware.demo.NoOpSensorDriver"
         # check we wrote out a file
         with open(app_settings.CONFIG_FILE) as f:
-            saved = yaml.safe_load(f)
+            saved = yaml.load(f, Loader=SafeLoader)
         assert saved["hardware"]["test"]["classinfo"] == "evolver.hardware.demo.NoOpSensorDriver"
 
+    def test_evolver_update_config_endpoint_ordering(self, app_client, monkeypatch):
+        started = []
+        create = Evolver.create
+
+        def slow_create(config):
+            started.append(config)
+            if len(started) == 1:
+                time.sleep(0.2)  # Give the second request a chance to overtake the first.
+            return create(config)
+
+        monkeypatch.setattr(Evolver, "create", slow_create)
+        # The requests below are sent from their own event loop, so use a lock for that loop, as the lifespan would.
+        monkeypatch.setattr(app.state, "update_lock", asyncio.Lock())
+
+        async def post_configs():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                configs = ({**Evolver.Config().model_dump(mode="json"), "name": name} for name in ("first", "second"))
+                return await asyncio.gather(*(client.post("/", json=config) for config in configs))
+
+        assert all(response.status_code == 200 for response in asyncio.run(post_configs()))
+        # The last config to be received is the one that ends up active.
+        assert app.state.evolver.name == started[-1].name
+        assert Evolver.Config.load(app_settings.CONFIG_FILE).name == started[-1].name
+
     def test_evolver_app_control_loop_setup(self, app_client):
         # TODO: check results generated in control() (may require hardware at startup, or forced execution of loop)
         response = app_client.get("/")
         assert response.status_code == 200
 
+    def test_evolver_app_control_loop_trigger(self, app_client):
+        evolver = Evolver(controllers=[NoOpController()])
+        app.state.evolver = evolver
+        app.state.loop_trigger.set()
+        for _ in range(100):
+            if evolver.controllers[0].ncalls:
+                break
+            time.sleep(0.01)
+        assert evolver.controllers[0].ncalls >= 1
+
     @pytest.mark.parametrize(
         "classinfo",
         (
@@ -84,7 +178,16 @@ class TestApp:
         response = app_client.get("/schema", params=dict(classinfo=fqn) if classinfo else None)
         assert response.status_code == 200
         # There's not much in the default config yet, this will change in future PRs.
-        assert json.loads(response.content) == SchemaResponse(classinfo=fqn).model_dump(mode="json")
+        assert response.json() == SchemaResponse(classinfo=fqn).model_dump(mode="json")
+
+    def test_schema_endpoint_cached(self, app_client):
+        response = app_client.get("/schema/")
+        hits = _schema_json.cache_info().hits
+        assert app_client.get("/schema/").content == response.content
+        # The default and explicitly given classinfo share the same cache entry.
+        fqn = evolver.util.fully_qualified_name(Evolver)
+        assert app_client.get("/schema/", params=dict(classinfo=fqn)).content == response.content
+        assert _schema_json.cache_info().hits == hits + 2
 
     @pytest.mark.parametrize("classinfo", ("this.is.not.a.class", "int", ""))
     def test_schema_endpoint_exception(self, app_client, classinfo):
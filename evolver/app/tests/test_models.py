@@ -33,3 +33,10 @@ def test_schema_response(classinfo):
         assert obj.output == classinfo.Output.model_json_schema()
     else:
         assert obj.output is None
+
+
+def test_schema_response_cached():
+    fqn = evolver.util.fully_qualified_name(NoOpSensorDriver)
+    response = SchemaResponse(classinfo=fqn)
+    response.output["title"] = "mutated"
+    assert SchemaResponse(classinfo=fqn).output == NoOpSensorDriver.Output.model_json_schema()
@@ -0,0 +1,17 @@
+import json
+
+from evolver.app.responses import ORJSONResponse
+from evolver.device import Evolver
+from evolver.hardware.demo import NoOpSensorDriver
+
+
+def test_orjson_response_serializes_models():
+    output = NoOpSensorDriver.Output(vial=0, raw=1, value=2)
+    response = ORJSONResponse({"state": {"test": {0: output}}})
+    assert json.loads(response.body) == {"state": {"test": {"0": output.model_dump(mode="json")}}}
+
+
+def test_orjson_response_serializes_config():
+    config = Evolver.Config()
+    response = ORJSONResponse({"config": config})
+    assert json.loads(response.body) == {"config": config.model_dump(mode="json")}
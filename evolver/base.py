@@ -1,4 +1,8 @@
+import copy
 import logging
+import os
+import shutil
+import tempfile
 from abc import ABC
 from pathlib import Path
 from typing import Annotated, Any, Dict
@@ -9,6 +13,35 @@ import yaml
 
 import evolver.util
 
+# Use libyaml's C implementations when available.
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+
+def _save_yaml(obj: Any, file_path: Path, encoding: str | None = None):
+    """Write ``obj`` as yaml to ``file_path``.
+
+    The yaml is first written to a temporary file that then atomically replaces ``file_path`` such that a failed or
+    interrupted write never leaves a truncated file behind.
+    """
+    file_path = Path(file_path)
+    f = tempfile.NamedTemporaryFile(
+        "w", encoding=encoding, dir=file_path.parent, prefix=f"{file_path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with f:
+            yaml.dump(obj, f, Dumper=SafeDumper)
+        if file_path.exists():
+            # The temporary file is created with owner only permissions so retain those of the file being replaced.
+            shutil.copymode(file_path, f.name)
+        os.replace(f.name, file_path)
+    except BaseException:
+        Path(f.name).unlink(missing_ok=True)
+        raise
+
 
 def require_all_fields(cls):
     """Decorate a model mutating it to one where all fields are required.
@@ -70,12 +103,11 @@ class _BaseConfig(pydantic.BaseModel):
     def load(cls, file_path: Path, encoding: str | None = None):
         """Loads the specified config file and return a new instance."""
         with open(file_path, encoding=encoding) as f:
-            return cls.model_validate(yaml.safe_load(f))
+            return cls.model_validate(yaml.load(f, Loader=SafeLoader))
 
     def save(self, file_path: Path, encoding: str | None = None):
         """Write out config as yaml file to specified file."""
-        with open(file_path, "w", encoding=encoding) as f:
-            yaml.dump(self.model_dump(mode="json"), f)
+        _save_yaml(self.model_dump(mode="json"), file_path, encoding=encoding)
 
 
 class BaseConfig(_BaseConfig):
@@ -155,12 +187,11 @@ class ConfigDescriptor(_BaseConfig):
     def load(cls, file_path: Path, encoding: str | None = None):
         """Loads the specified config file and return a new instance."""
         with open(file_path, encoding=encoding) as f:
-            return cls.model_validate(yaml.safe_load(f))
+            return cls.model_validate(yaml.load(f, Loader=SafeLoader))
 
     def save(self, file_path: Path, encoding: str | None = None):
         """Write out config as yaml file to specified file."""
-        with open(file_path, "w", encoding=encoding) as f:
-            yaml.dump(self.model_dump(mode="json"), f)
+        _save_yaml(self.model_dump(mode="json"), file_path, encoding=encoding)
 
 
 class BaseInterface(ABC):
@@ -210,6 +241,11 @@ class BaseInterface(ABC):
             config = cls.Config()
         elif isinstance(config, ConfigDescriptor):
             config = validate_descriptor(config)
+        elif isinstance(config, cls.Config):
+            # Already a valid Config instance so there's no need to re-validate it. Note: List and dict fields are
+            # copied since any ``ConfigDescriptor`` within them get replaced in-place upon instantiation, see
+            # ``init_and_set_vars_from_descriptors()``, and we mustn't mutate the caller's config.
+            config = config.model_copy(update={k: copy.copy(v) for k, v in config if isinstance(v, (list, dict))})
         else:
             # Next handle dict | str, which could be that representing a Config or a ConfigDescriptor.
             # First see if config is actually a descriptor by trying to create one, since it's only fields are limited
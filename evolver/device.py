@@ -42,7 +42,10 @@ class Evolver(BaseInterface):
 
     @property
     def calibration_status(self):
-        return {name: device.calibrator.status for name, device in self.hardware.items()}
+        return {
+            name: None if device.calibrator is None else device.calibrator.status
+            for name, device in self.hardware.items()
+        }
 
     @property
     def state(self):
@@ -30,7 +30,7 @@ class HardwareDriver(BaseInterface):
     class Config(BaseConfig):
         pass
 
-    calibrator = None
+    calibrator: BaseCalibrator | None = None
 
     def __init__(self, *args, evolver=None, calibrator=None, **kwargs):
         self.evolver = evolver
@@ -60,6 +60,11 @@ class SensorDriver(VialHardwareDriver):
 
     @abstractmethod
     def read(self):
+        """Read from the hardware and populate ``outputs``.
+
+        Note: ``outputs`` may be read concurrently, e.g., by the app whilst the control loop is running, so
+        implementations should assign a new, fully populated dict to ``outputs`` rather than update it in place.
+        """
         pass
 
 
@@ -51,12 +51,12 @@ class Temperature(SensorDriver, EffectorDriver):
         return response
 
     def read(self):
-        self.outputs.clear()
         response = self._do_serial()
-        for vial, raw in enumerate(response.data):
-            if vial in self.vials:
-                # calibration should happen here to populate temperature field from raw
-                self.outputs[vial] = self.Output(vial=vial, raw=int(raw))
+        # Replace rather than update outputs in place, see ``SensorDriver.read``.
+        # calibration should happen here to populate temperature field from raw
+        self.outputs = {
+            vial: self.Output(vial=vial, raw=int(raw)) for vial, raw in enumerate(response.data) if vial in self.vials
+        }
 
     def commit(self):
         self._do_serial(from_proposal=True)
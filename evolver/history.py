@@ -1,3 +1,4 @@
+import bisect
 import time
 from abc import abstractmethod
 from collections import defaultdict
@@ -14,7 +15,7 @@ class History(BaseInterface):
         pass
 
     @abstractmethod
-    def get(self, query):
+    def get(self, name, t_start: float | None = None, t_stop: float | None = None):
         pass
 
 
@@ -22,12 +23,26 @@ class HistoryServer(History):
     class Config(History.Config):
         name: str = "HistoryServer"
 
-    def __init__(self, *args, **kwargs):
-        self.history = defaultdict(list)
+    def __init__(self, *args, clock=time.time, **kwargs):
+        # Timestamps and data are stored as separate columns such that time windowed queries can bisect the (sorted)
+        # timestamps rather than scan all records.
+        self.timestamps = defaultdict(list)
+        self.data = defaultdict(list)
+        self.clock = clock
         super().__init__(*args, **kwargs)
 
     def put(self, name, data):
-        self.history[name].append((time.time(), data))
-
-    def get(self, name):
-        return self.history[name]
+        timestamps = self.timestamps[name]
+        # Timestamps must remain sorted for ``get`` to bisect them, however, the wall clock can step backwards (e.g., an
+        # NTP sync on a board without an RTC). Records are therefore never timestamped earlier than the previous one.
+        timestamps.append(max(self.clock(), timestamps[-1]) if timestamps else self.clock())
+        self.data[name].append(data)
+
+    def get(self, name, t_start: float | None = None, t_stop: float | None = None):
+        """Return a list of ``(timestamp, data)`` for ``name``, optionally limited to those where
+        ``t_start <= timestamp <= t_stop``.
+        """
+        timestamps = self.timestamps.get(name, [])
+        start = 0 if t_start is None else bisect.bisect_left(timestamps, t_start)
+        stop = len(timestamps) if t_stop is None else bisect.bisect_right(timestamps, t_stop)
+        return list(zip(timestamps[start:stop], self.data.get(name, [])[start:stop]))
@@ -20,6 +20,7 @@ class AppSettings(BaseSettings):
     LOAD_FROM_CONFIG_ON_STARTUP: bool = True
     HOST: str = "127.0.0.1"
     PORT: int = 8080
+    ACCESS_LOG: bool = False
 
 
 settings = Settings()
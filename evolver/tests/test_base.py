@@ -269,3 +269,24 @@ def test_require_all_fields():
 
     with pytest.raises(pydantic.ValidationError, match="Field required"):
         ConfigWithoutDefaults(a=1)
+
+
+def test_save_is_atomic(tmp_path, monkeypatch):
+    file_path = tmp_path / "config.yml"
+    ConcreteInterface.Config(a=1).save(file_path)
+    assert ConcreteInterface.Config.load(file_path).a == 1
+    assert list(tmp_path.iterdir()) == [file_path]
+    # Permissions of the replaced file are retained.
+    file_path.chmod(0o640)
+    ConcreteInterface.Config(a=1).save(file_path)
+    assert file_path.stat().st_mode & 0o777 == 0o640
+
+    def failing_dump(*args, **kwargs):
+        raise RuntimeError("failed")
+
+    monkeypatch.setattr(evolver.base.yaml, "dump", failing_dump)
+    with pytest.raises(RuntimeError, match="failed"):
+        ConcreteInterface.Config(a=2).save(file_path)
+    # The existing file is left untouched and no temporary file is left behind.
+    assert ConcreteInterface.Config.load(file_path).a == 1
+    assert list(tmp_path.iterdir()) == [file_path]
@@ -6,7 +6,7 @@ import evolver.base
 from evolver.connection.interface import Connection
 from evolver.controller.interface import Controller
 from evolver.device import DEFAULT_HISTORY, DEFAULT_SERIAL, Evolver
-from evolver.hardware.demo import NoOpSensorDriver
+from evolver.hardware.demo import NoOpCalibrator, NoOpSensorDriver
 from evolver.hardware.interface import HardwareDriver
 from evolver.history import History
 
@@ -92,6 +92,15 @@ class TestEvolver:
         obj2 = Evolver.create(obj1.config)
         assert obj1.config == obj2.config
 
+    def test_create_from_config_instance(self, conf_with_driver):
+        config = Evolver.Config.model_validate(conf_with_driver)
+        obj1 = Evolver.create(config)
+        obj2 = Evolver.create(config)
+        assert isinstance(config.hardware["testsensor"], evolver.base.ConfigDescriptor)
+        assert isinstance(obj1.hardware["testsensor"], NoOpSensorDriver)
+        assert obj1.hardware["testsensor"] is not obj2.hardware["testsensor"]
+        assert obj1.config == Evolver.create(conf_with_driver).config
+
     def test_with_driver(self, demo_evolver):
         assert isinstance(demo_evolver.hardware["testsensor"], NoOpSensorDriver)
 
@@ -117,6 +126,10 @@ class TestEvolver:
         obj = Evolver.create(conf_with_driver)
         assert "testeffector" not in obj.hardware
 
+    def test_calibration_status(self):
+        obj = Evolver(hardware={"a": NoOpSensorDriver(calibrator=NoOpCalibrator()), "b": NoOpSensorDriver()})
+        assert obj.calibration_status == {"a": True, "b": None}
+
     def test_schema(self):
         Evolver.Config.model_json_schema()
 
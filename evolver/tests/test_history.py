@@ -0,0 +1,47 @@
+import pytest
+
+from evolver.history import HistoryServer
+
+
+@pytest.fixture
+def history():
+    times = iter(range(10))
+    obj = HistoryServer(clock=lambda: next(times))
+    for i in range(5):
+        obj.put("a", {"value": i})
+        obj.put("b", {"value": -i})
+    return obj
+
+
+class TestHistoryServer:
+    def test_get(self, history):
+        assert history.get("a") == [(t, {"value": i}) for i, t in enumerate(range(0, 10, 2))]
+        assert history.get("b") == [(t, {"value": -i}) for i, t in enumerate(range(1, 10, 2))]
+
+    def test_get_missing(self, history):
+        assert history.get("c") == []
+        assert "c" not in history.timestamps
+
+    @pytest.mark.parametrize(
+        "t_start, t_stop, expected",
+        [
+            (None, None, [0, 2, 4, 6, 8]),
+            (2, None, [2, 4, 6, 8]),
+            (3, None, [4, 6, 8]),
+            (None, 4, [0, 2, 4]),
+            (2, 6, [2, 4, 6]),
+            (3, 3, []),
+            (9, None, []),
+        ],
+    )
+    def test_get_window(self, history, t_start, t_stop, expected):
+        assert [t for t, _ in history.get("a", t_start=t_start, t_stop=t_stop)] == expected
+
+    def test_clock_step_back(self):
+        times = iter([100, 101, 50, 51, 102])
+        history = HistoryServer(clock=lambda: next(times))
+        for i in range(5):
+            history.put("a", i)
+        assert history.get("a") == [(100, 0), (101, 1), (101, 2), (101, 3), (102, 4)]
+        assert history.get("a", t_start=100, t_stop=102) == history.get("a")
+        assert history.get("a", t_start=50, t_stop=51) == []